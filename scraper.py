@@ -21,17 +21,29 @@ import json
 import time
 import re
 import io
+import hashlib
 import threading  # Added for lock
+import tempfile
+import multiprocessing
+from functools import wraps
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import chain
+from concurrent.futures import (
+    ThreadPoolExecutor,
+    ProcessPoolExecutor,
+    as_completed,
+)
 from urllib.parse import urljoin
 
 # Third-party imports
 import pandas as pd
 import gspread
 import requests
-from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
 import pdfplumber
 from dateutil.parser import parse as date_parse  # For flexible date parsing
 from selenium import webdriver
@@ -43,39 +55,112 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     StaleElementReferenceException,
+    WebDriverException,
 )
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
 
-# Try importing tenacity for retries
+# Try importing requests-cache for conditional HTTP caching
 try:
-    from tenacity import (
-        retry,
-        retry_if_exception_type,
-        stop_after_attempt,
-        wait_exponential,
-    )
+    import requests_cache
 
-    TENACITY_AVAILABLE = True
+    REQUESTS_CACHE_AVAILABLE = True
 except ImportError:
-    TENACITY_AVAILABLE = False
-
-    def retry(*args, **kwargs):
-        return lambda f: f
-
-    stop_after_attempt = wait_exponential = retry_if_exception_type = None
-
+    REQUESTS_CACHE_AVAILABLE = False
 
 # --- CONFIGURATION ---
 SHEET_ID = os.getenv("SHEET_ID", "1V0ERkUXzc2G_SvSVUaVac50KyNOpw4N7bL6yAiZospY")
 MASTER_TAB_NAME = "Master_Registry"  # This will be the combined tab
 CREDENTIALS_FILE = "credentials.json"
 GOOGLE_CREDENTIALS_ENV = os.getenv("GOOGLE_CREDENTIALS")
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets",
+    "https://www.googleapis.com/auth/drive",
+]
 WEBHOOK_URL = os.getenv("ALERT_WEBHOOK_URL")
 
 SELENIUM_TIMEOUT = 30
-MAX_WORKERS = 12
+REQUEST_TIMEOUT = (5, 45)  # (connect, read) seconds; dead hosts fail fast
+# Chrome instances are memory-bound; plain HTTP scrapers just wait on I/O.
+MAX_SELENIUM_WORKERS = int(os.getenv("MAX_SELENIUM_WORKERS", "3"))
+MAX_HTTP_WORKERS = int(os.getenv("MAX_HTTP_WORKERS", "16"))
+UPLOAD_CHUNK_SIZE = 1000  # Rows per values range in a Sheets write
+UPLOAD_MAX_BYTES = 8 * 1024 * 1024  # Per write request; the API caps at 10 MB
+BACKUP_DIR = "data"  # Daily Master Registry snapshots, committed by CI
 DRY_RUN = "--dry-run" in sys.argv
+CACHE_DIR = ".cache"  # Same-day scraper results, reused on re-runs
+PDF_CACHE_DIR = os.path.join(CACHE_DIR, "pdf")  # Extracted pages by content hash
+NO_CACHE = "--no-cache" in sys.argv
+# Seconds a cached HTTP response is served without revalidation. 0 keeps
+# production on conditional GETs; local reruns can set e.g. 3600.
+HTTP_CACHE_TTL = int(os.getenv("HTTP_CACHE_TTL", "0"))
+TODAY = datetime.now().strftime("%Y-%m-%d")  # Refreshed at the start of main()
+
+# Per-scraper Selenium gate. False = main() reads the server-rendered results
+# page with the *_static scraper in the HTTP pool first, and only queues the
+# Chrome scraper if that yields no records. True = straight to Chrome.
+USE_SELENIUM = {
+    "Hillsborough": False,
+    "Pasco": False,
+    "Brevard": False,
+    "Miami-Dade": False,
+}
+
+# pandas 3 always copies on write; 2.x needs it switched on.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.options.mode.copy_on_write = True
+
+# Arrow-backed strings: the cleanup regexes, sort and drop_duplicates run in
+# Arrow's kernels instead of over Python str objects. pyarrow is already
+# required for the Parquet backup.
+STRING_DTYPE = "string[pyarrow]"
+
+# --- PRECOMPILED PATTERNS ---
+# Compiled once at import rather than looked up in re's cache per row.
+NEXT_LINK_RE = re.compile(r"Next|>")  # Pager links on registry tables
+
+# Column-wide .str.replace patterns stay plain strings: pandas only hands a
+# str pattern to Arrow's regex kernel, a compiled re.Pattern falls back to
+# a per-row Python loop. That kernel is RE2, where \s is ASCII-only, so
+# \p{Z} adds the &nbsp; and other Unicode spaces common in scraped tables.
+WHITESPACE_PATTERN = r"[\s\p{Z}]+"
+NAME_PUNCT_PATTERN = r"[.,]"
+NAME_LAST_FIRST_PATTERN = (
+    r"^[\s\p{Z}]*([A-Z\'-]+)[\s\p{Z}]*,[\s\p{Z}]*([A-Z\s\p{Z}\'-]+)[\s\p{Z}]*$"
+)
+
+# Marion registry entries
+MARION_NAME_LABEL_RE = re.compile(r"Name:", re.I)
+MARION_NAME_RE = re.compile(r"Name:\s*([^|]+)", re.I)
+MARION_DATE_RE = re.compile(r"(Conviction) Date:\s*([^|]+)", re.I)
+
+# Seminole PDF link discovery and "Key: value" record lines
+SEMINOLE_LINK_TEXT_RE = re.compile(
+    r"(view|download|open|access).*registry|report", re.I
+)
+SEMINOLE_LINK_HREF_RE = re.compile(r"AnimalCruelty", re.I)
+SEMINOLE_SPLIT_RE = re.compile(r"(?=\nName:)", re.IGNORECASE)
+SEMINOLE_FIELD_RE = re.compile(r"^([^:]{1,30}):\s*(.*)")
+
+# Polk registrant cards (lxml XPath, compiled once like the regexes)
+POLK_REGISTRANT_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' registrant ')]"
+)
+POLK_FIELD_XPATH = etree.XPath(".//p[.//strong and .//span]")
+
+# Osceola case numbers, e.g. 2024-MM-001234
+OSCEOLA_CASE_RE = re.compile(r"(\d{4}-\w{2}-\d{6})")
+
+# Palm Beach registry table
+PALMBEACH_SUMMARY_RE = re.compile(r"Animal Abuse Registry", re.I)
+PALMBEACH_ID_RE = re.compile(r"Registry", re.I)
+
+# Volusia PDF record fields
+VOLUSIA_SPLIT_RE = re.compile(r"Name:", re.IGNORECASE)
+VOLUSIA_DOB_RE = re.compile(r"DOB:\s*(.*)", re.IGNORECASE)
+VOLUSIA_CASE_RE = re.compile(r"Case Number:\s*(.*)", re.IGNORECASE)
+VOLUSIA_DATE_RE = re.compile(r"Conviction Date:\s*(.*)", re.IGNORECASE)
+VOLUSIA_OFFENSE_RE = re.compile(r"Offense:\s*([\s\S]*)", re.IGNORECASE)
 
 logging.basicConfig(
     level=logging.INFO,
@@ -83,8 +168,8 @@ logging.basicConfig(
 )
 logger = logging.getLogger("DNAFL_Scraper")
 
-if not TENACITY_AVAILABLE:
-    logger.warning("Tenacity library not available. Retries are disabled.")
+if not REQUESTS_CACHE_AVAILABLE:
+    logger.warning("requests-cache not available. HTTP caching is disabled.")
 
 # --- CORE UTILITIES ---
 
@@ -93,8 +178,45 @@ driver_manager_lock = threading.Lock()
 GLOBAL_DRIVER_PATH = None
 
 
+# One Chrome per Selenium worker thread, reused across scrapers instead of
+# a cold start for every `with SeleniumDriver()`.
+driver_local = threading.local()
+active_drivers_lock = threading.Lock()
+ACTIVE_DRIVERS = []  # Every live driver, so main() can quit them all
+
+
 class SeleniumDriver:
+    """
+    Yields this thread's reusable Chrome. Cookies are cleared on a clean
+    exit; a driver that raised is quit and rebuilt on next use.
+    """
     def __enter__(self):
+        self.driver = getattr(driver_local, "driver", None)
+        if self.driver is None:
+            self.driver = self._launch()
+            driver_local.driver = self.driver
+            with active_drivers_lock:
+                ACTIVE_DRIVERS.append(self.driver)
+        return self.driver
+
+    def __exit__(self, exc_type, *_):
+        if exc_type is None:
+            try:
+                self.driver.delete_all_cookies()
+                return
+            except WebDriverException as e:
+                logger.warning(f"Driver unusable after scrape, restarting: {e}")
+        driver_local.driver = None
+        with active_drivers_lock:
+            if self.driver in ACTIVE_DRIVERS:
+                ACTIVE_DRIVERS.remove(self.driver)
+        try:
+            self.driver.quit()
+        except WebDriverException:
+            pass
+
+    @staticmethod
+    def _launch():
         global GLOBAL_DRIVER_PATH  # Use the global path
         opts = Options()
         opts.add_argument("--headless=new")
@@ -146,7 +268,7 @@ class SeleniumDriver:
                     logger.debug(f"Using cached driver path: {GLOBAL_DRIVER_PATH}")
 
             service = ChromeService(executable_path=GLOBAL_DRIVER_PATH)
-            self.driver = webdriver.Chrome(service=service, options=opts)
+            driver = webdriver.Chrome(service=service, options=opts)
 
         except Exception as e:
             logger.critical(
@@ -158,19 +280,118 @@ class SeleniumDriver:
             )
             raise
 
-        self.driver.set_page_load_timeout(60)
-        return self.driver
+        driver.set_page_load_timeout(60)
+        return driver
 
-    def __exit__(self, *_):
-        if hasattr(self, "driver"):
-            self.driver.quit()
+
+def quit_all_drivers():
+    with active_drivers_lock:
+        drivers = ACTIVE_DRIVERS[:]
+        ACTIVE_DRIVERS.clear()
+    for driver in drivers:
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+# Reads every matching row in one WebDriver round-trip instead of one
+# request per `find_elements` / `.text` call.
+TABLE_ROWS_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (row) {
+    var img = row.querySelector('img');
+    return [
+        Array.from(row.querySelectorAll('td')).map(function (c) {
+            return c.innerText.trim();
+        }),
+        img ? img.src : null
+    ];
+});
+"""
+
+
+# Serializes only the matching elements, so the DevTools payload is the
+# fragment we parse rather than the whole page_source.
+OUTER_HTML_JS = """
+return Array.from(document.querySelectorAll(arguments[0])).map(function (el) {
+    return el.outerHTML;
+}).join('');
+"""
+
+
+def extract_fragment(driver, selector):
+    """
+    Returns an lxml element wrapping the outerHTML of every element matching
+    `selector`, read in one WebDriver round-trip.
+    """
+    html = driver.execute_script(OUTER_HTML_JS, selector) or ""
+    return lxml.html.fragment_fromstring(html, create_parent="div")
+
+
+# First populated data cell. Tables often render empty and fill in later,
+# so waiting on the <table> alone can read zero rows.
+DATA_CELL = (By.CSS_SELECTOR, "table tr td")
+
+
+def extract_table_rows(driver, row_selector="table tr"):
+    """
+    Returns a list of (cells, img_src) for every row matching `row_selector`.
+    `cells` holds the stripped text of each <td>; `img_src` is the absolute
+    URL of the first <img> in the row, or None.
+    """
+    rows = driver.execute_script(TABLE_ROWS_JS, row_selector) or []
+    return [(cells, img_src) for cells, img_src in rows]
+
+
+def parse_table_rows(soup, base_url, row_selector="table tr"):
+    """
+    Static-HTML counterpart of extract_table_rows(), with the same
+    (cells, img_src) shape so scrapers can share their row handling.
+    """
+    rows = []
+    for row in soup.select(row_selector):
+        cells = [c.get_text(strip=True) for c in row.find_all("td")]
+        img = row.find("img")
+        img_src = urljoin(base_url, img["src"]) if img and img.get("src") else None
+        rows.append((cells, img_src))
+    return rows
+
+
+def single_string(el):
+    """
+    lxml counterpart of BeautifulSoup's `.string`: the text of an element
+    whose only content is one string (possibly through single-child
+    wrappers), else None.
+    """
+    children = list(el)
+    if not children:
+        return el.text
+    if len(children) == 1 and not el.text and not children[0].tail:
+        return single_string(children[0])
+    return None
+
+
+def stripped_text(el):
+    """lxml counterpart of BeautifulSoup's `get_text(strip=True)`."""
+    return "".join(t.strip() for t in el.itertext())
+
+
+# Per-thread flag for the scraper currently running: set when it hit an
+# error after which its records may be partial, so daily_cache() doesn't
+# pin them for the rest of the day.
+scrape_state = threading.local()
+
+
+def mark_incomplete():
+    scrape_state.incomplete = True
 
 
 def alert_failure(message):
     logger.error(message)
+    mark_incomplete()
     if WEBHOOK_URL and not DRY_RUN:
         try:
-            requests.post(
+            SESSION.post(
                 WEBHOOK_URL,
                 json={"text": f"🚨 **DNAFL Scraper Alert** 🚨\n{message}"},
                 timeout=5,
@@ -180,41 +401,60 @@ def alert_failure(message):
 
 
 def get_gspread_client():
-    scopes = [
-        "https://www.googleapis.com/auth/spreadsheets",
-        "https://www.googleapis.com/auth/drive",
-    ]
+    # gspread builds the service-account credentials and a keep-alive
+    # authorized session itself, refreshing the token as needed.
     try:
         if GOOGLE_CREDENTIALS_ENV:
             creds_json = json.loads(GOOGLE_CREDENTIALS_ENV)
-            creds = Credentials.from_service_account_info(creds_json, scopes=scopes)
+            return gspread.service_account_from_dict(creds_json, scopes=SCOPES)
         elif os.path.exists(CREDENTIALS_FILE):
-            creds = Credentials.from_service_account_file(
-                CREDENTIALS_FILE, scopes=scopes
-            )
+            return gspread.service_account(filename=CREDENTIALS_FILE, scopes=SCOPES)
         else:
             logger.error("No Google credentials found.")
             return None
-        return gspread.authorize(creds)
     except Exception as e:
         logger.error(f"Failed to create gspread client: {e}")
         return None
 
 
-@retry(
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=4, max=10),
-    retry=retry_if_exception_type(requests.exceptions.RequestException)
-    if TENACITY_AVAILABLE
-    else None,
+# One pooled session for every plain HTTP fetch: keep-alive connections are
+# reused across retries and scraper threads instead of a fresh TCP+TLS
+# handshake per request. urllib3 retries transient failures with backoff.
+# With requests-cache, responses carrying an ETag/Last-Modified are kept in
+# CACHE_DIR and revalidated once HTTP_CACHE_TTL has passed, so a source
+# that hasn't changed since the last run answers with a bodyless 304.
+if REQUESTS_CACHE_AVAILABLE and not NO_CACHE:
+    SESSION = requests_cache.CachedSession(
+        os.path.join(CACHE_DIR, "http_cache"),
+        backend="sqlite",
+        expire_after=HTTP_CACHE_TTL,
+        allowable_methods=("GET",),  # Never replay the webhook POST
+        wal=True,  # Concurrent scraper threads read while one writes
+    )
+else:
+    SESSION = requests.Session()
+SESSION.headers["User-Agent"] = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
+)
+_adapter = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
 )
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+
 def fetch_url(url, stream=False, verify=True):
     try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0.0.0 Safari/537.36"
-        }
-        resp = requests.get(
-            url, timeout=45, stream=stream, verify=verify, headers=headers
+        resp = SESSION.get(
+            url, timeout=REQUEST_TIMEOUT, stream=stream, verify=verify
         )
         resp.raise_for_status()
         return resp
@@ -232,18 +472,149 @@ def fetch_url(url, stream=False, verify=True):
         raise
 
 
+# Shared process pool for CPU-bound PDF text extraction. "spawn" keeps the
+# workers clear of locks held by the scraper threads at fork time.
+pdf_pool_lock = threading.Lock()
+PDF_POOL = None
+
+
+def get_pdf_pool():
+    global PDF_POOL
+    with pdf_pool_lock:
+        if PDF_POOL is None:
+            PDF_POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count() or 1,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return PDF_POOL
+
+
+def shutdown_pdf_pool():
+    global PDF_POOL
+    with pdf_pool_lock:
+        if PDF_POOL is not None:
+            PDF_POOL.shutdown()
+            PDF_POOL = None
+
+
+def _extract_page_text(args):
+    """Process-pool worker: extracts the text of a single PDF page."""
+    pdf_file, page_no = args
+    with pdfplumber.open(pdf_file) as pdf:
+        return pdf.pages[page_no].extract_text(x_tolerance=1, y_tolerance=1)
+
+
+def _extract_page_tables(args):
+    """Process-pool worker: extracts the tables of a single PDF page."""
+    pdf_file, page_no, table_settings = args
+    try:
+        with pdfplumber.open(pdf_file) as pdf:
+            return pdf.pages[page_no].extract_tables(table_settings)
+    except Exception as e:
+        logger.warning(f"Error extracting tables from PDF page {page_no + 1}: {e}")
+        return None  # Tells map_pdf_pages() the result is partial
+
+
+# PDF cache entries read or written this run; everything else is pruned at
+# the end of main() so CI's saved cache doesn't keep every past PDF.
+pdf_cache_used = set()
+
+
+def _use_pdf_cache(path):
+    """Marks a PDF cache entry as live for this run and, when called inside
+    a daily_cache() scraper, for that scraper's cached result."""
+    pdf_cache_used.add(path)
+    scraper_paths = getattr(scrape_state, "pdf_cache", None)
+    if scraper_paths is not None:
+        scraper_paths.add(path)
+
+
+def map_pdf_pages(content, worker, *args):
+    """
+    Runs worker((pdf, page_no, *args)) for every page of the PDF bytes and
+    returns the results in page order. Results are cached on disk by a
+    hash of the bytes, so an unchanged PDF skips pdfplumber entirely.
+    """
+    key = hashlib.sha256(content)
+    key.update(f"{worker.__name__}{args!r}".encode())
+    path = os.path.join(PDF_CACHE_DIR, f"{key.hexdigest()}.json")
+    if not NO_CACHE and os.path.exists(path):
+        try:
+            with open(path, encoding="utf-8") as f:
+                results = json.load(f)
+            _use_pdf_cache(path)
+            return results
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable PDF cache {path}: {e}")
+
+    results = _map_pdf_pages(content, worker, *args)
+    if worker is _extract_page_tables and None in results:
+        # A page failed (blank text pages are None too, hence the worker
+        # check); keep it out of the cache so the next run retries.
+        mark_incomplete()
+    elif not NO_CACHE:
+        try:
+            os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(results, f)
+            _use_pdf_cache(path)
+        except (OSError, TypeError) as e:
+            logger.warning(f"Failed to cache PDF pages: {e}")
+    return results
+
+
+def prune_pdf_cache():
+    """
+    Deletes PDF cache entries this run didn't touch: superseded versions of
+    a PDF, or sources that no longer link one. Skipped when nothing was
+    used, so a run that couldn't reach any PDF keeps the cache intact.
+    """
+    if NO_CACHE or not pdf_cache_used or not os.path.isdir(PDF_CACHE_DIR):
+        return
+    removed = 0
+    for name in os.listdir(PDF_CACHE_DIR):
+        path = os.path.join(PDF_CACHE_DIR, name)
+        if path not in pdf_cache_used:
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to prune PDF cache {path}: {e}")
+    if removed:
+        logger.info(f"Pruned {removed} stale PDF cache entries.")
+
+
+def _map_pdf_pages(content, worker, *args):
+    # One download into a seekable in-memory buffer; pdfplumber never
+    # has to re-read a raw socket stream.
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        n_pages = len(pdf.pages)
+    if n_pages <= 1:
+        return [worker((io.BytesIO(content), i, *args)) for i in range(n_pages)]
+
+    # Workers re-open the PDF by path, so spill it to disk once.
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as tmp:
+        tmp.write(content)
+        tmp_path = tmp.name
+    try:
+        # Drain the lazy map before the file is removed.
+        return list(
+            get_pdf_pool().map(
+                worker, [(tmp_path, i, *args) for i in range(n_pages)]
+            )
+        )
+    finally:
+        os.remove(tmp_path)
+
+
 def extract_text_from_pdf(url):
     """Helper to robustly extract all text from a PDF URL."""
     text_content = []
     try:
         resp = fetch_url(url, stream=False, verify=False)
-        pdf_file = io.BytesIO(resp.content)
-
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text(x_tolerance=1, y_tolerance=1)
-                if page_text:
-                    text_content.append(page_text) # Append full page text
+        page_texts = map_pdf_pages(resp.content, _extract_page_text)
+        # Keep page order; drop pages with no text
+        text_content = [page_text for page_text in page_texts if page_text]
     except requests.exceptions.RequestException as e:
         logger.warning(f"Failed to fetch PDF from {url}: {e}")
     except pdfplumber.PDFSyntaxError as e:
@@ -271,6 +642,59 @@ FINAL_COLUMNS = [
 ]
 
 
+def _clean_text(s):
+    """Fills gaps with N/A, collapses whitespace and trims a text column."""
+    # One pass per column into a contiguous Arrow string array. Every
+    # FINAL_COLUMNS field is text, so no dtype check is needed.
+    return (
+        s.fillna("N/A")
+        .astype(STRING_DTYPE)
+        .str.replace(WHITESPACE_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+
+
+def _normalize_names(names):
+    """Upper-cases names, drops punctuation and flips LAST, FIRST."""
+    return (
+        names.str.upper()
+        .str.replace(NAME_PUNCT_PATTERN, "", regex=True)
+        .str.replace(NAME_LAST_FIRST_PATTERN, r"\2 \1", regex=True)
+        .str.replace(WHITESPACE_PATTERN, " ", regex=True)
+        .str.strip()
+    )
+
+
+def _parse_dates(dates):
+    """Parses a column of date strings to datetime64, NaT where unknown."""
+    def flexible_date_parse(date_str):
+        if date_str in ["N/A", "Unknown", ""]:
+            return pd.NaT
+        try:
+            # v5.9 FIX: Set fuzzy=True to parse "28-JAN-2019" etc.
+            # Offsets are dropped so the calendar date stays as written.
+            return date_parse(date_str, fuzzy=True).replace(tzinfo=None)
+        except:
+            return pd.NaT
+
+    # Vectorized parse first (cache=True parses each distinct string
+    # once); only the leftovers fall back to per-row fuzzy parsing.
+    try:
+        parsed = pd.to_datetime(dates, errors="coerce", format="mixed", cache=True)
+        if parsed.dt.tz is not None:
+            parsed = parsed.dt.tz_localize(None)
+    except ValueError:
+        # Naive and offset strings mixed in one column ("Mixed timezones
+        # detected"), which coerce doesn't catch: parse every row instead.
+        parsed = pd.Series(pd.NaT, index=dates.index, dtype="datetime64[ns]")
+    missed = parsed.isna() & ~dates.isin(["N/A", "Unknown", ""])
+    if missed.any():
+        parsed[missed] = pd.to_datetime(
+            dates[missed].apply(flexible_date_parse), errors="coerce"
+        )
+    return parsed
+
+
 def standardize_data(df):
     """
     Standardizes a DataFrame to match the FINAL_COLUMNS schema.
@@ -278,52 +702,32 @@ def standardize_data(df):
     if df.empty:
         return df
     try:
-        for col in FINAL_COLUMNS:
-            if col not in df.columns:
-                df[col] = "N/A"
-
-        df = df.reindex(columns=FINAL_COLUMNS)
-
-        for col in df.columns:
-            if df[col].dtype == "object":
-                df[col] = (
-                    df[col]
-                    .fillna("N/A")
-                    .astype(str)
-                    .str.strip()
-                    .str.replace(r"\s+", " ", regex=True)
-                )
-
-        if "Name" in df.columns:
-            logger.debug("Normalizing 'Name' column...")
-            df["Name"] = df["Name"].str.upper().str.replace(r"[.,]", "", regex=True)
-            df["Name"] = df["Name"].str.replace(
-                r"^\s*([A-Z\'-]+)\s*,\s*([A-Z\s\'-]+)\s*$",
-                r"\2 \1",
-                regex=True,
+        # Single chain: each step returns a new frame, so copy-on-write
+        # can share untouched columns instead of copying them.
+        # Low-cardinality columns become categories so dedup hashes integer
+        # codes.
+        df = (
+            df.reindex(columns=FINAL_COLUMNS, fill_value="N/A")
+            .apply(_clean_text)
+            .assign(
+                Name=lambda d: _normalize_names(d["Name"]),
+                Date_Parsed=lambda d: _parse_dates(d["Date"]),
+                Date=lambda d: d["Date_Parsed"]
+                .dt.strftime("%Y-%m-%d")
+                .fillna("Unknown"),
             )
-            df["Name"] = df["Name"].str.replace(r"\s+", " ", regex=True).str.strip()
-
-        if "Date" in df.columns:
-            def flexible_date_parse(date_str):
-                if date_str in ["N/A", "Unknown", ""]:
-                    return pd.NaT
-                try:
-                    # v5.9 FIX: Set fuzzy=True to parse "28-JAN-2019" etc.
-                    return date_parse(date_str, fuzzy=True)
-                except:
-                    return pd.NaT
-
-            # v6.0 FIX: Wrap in pd.to_datetime to fix .dt accessor crash
-            df["Date_Parsed"] = pd.to_datetime(
-                df["Date"].apply(flexible_date_parse), errors='coerce'
-            )
-            df["Date"] = df["Date_Parsed"].dt.strftime("%Y-%m-%d").fillna("Unknown")
-            # --- END v6.0 FIX ---
-
+            .astype({"County": "category", "Source": "category", "Type": "category"})
+        )
+        # Nothing to sort or dedupe in a single row
+        if len(df) < 2:
+            return df.drop(columns=["Date_Parsed"])
+        # The sort runs on the datetime64 column (int64 compares), and rows
+        # with unknown dates still lead.
         return (
-            df.drop(columns=["Date_Parsed"], errors="ignore")
-            .sort_values("Date", ascending=False)
+            df.sort_values(
+                "Date_Parsed", ascending=False, na_position="first", kind="stable"
+            )
+            .drop(columns=["Date_Parsed"])
             .drop_duplicates(subset=["Name", "County", "Date"])
         )
     except Exception as e:
@@ -331,56 +735,196 @@ def standardize_data(df):
         return pd.DataFrame()
 
 
-def upload_to_sheet(gc, sheet_id, tab_name, df):
+def dedupe_records(records):
     """
-    Helper function to upload a DataFrame to a specific tab.
+    Drops exact (Name, Date, County) repeats with a set lookup before a
+    DataFrame is built. standardize_data still dedupes on the normalized
+    values, which can collapse rows that differ only in formatting.
     """
-    if df.empty:
-        logger.warning(f"No data to upload for tab '{tab_name}'. Skipping.")
+    seen = set()
+    deduped = []
+    for record in records:
+        key = (record.get("Name"), record.get("Date"), record.get("County"))
+        if key not in seen:
+            seen.add(key)
+            deduped.append(record)
+    return deduped
+
+
+def upload_tabs(sh, tabs):
+    """
+    Uploads {tab name: DataFrame} to the spreadsheet in batched API calls.
+    """
+    tabs = {name: df for name, df in tabs.items() if not df.empty}
+    if not tabs:
+        logger.warning("No data to upload. Skipping.")
         return
 
     if DRY_RUN:
-        try:
-            filename = f"dry_run_{tab_name.replace(' ', '_')}.csv"
-            df.to_csv(filename, index=False)
-            logger.info(f"DRY RUN: Saved {len(df)} records to {filename}")
-        except Exception as e:
-            logger.error(f"DRY RUN: Failed to save CSV for {tab_name}: {e}")
+        for tab_name, df in tabs.items():
+            try:
+                filename = f"dry_run_{tab_name.replace(' ', '_')}.csv"
+                df.to_csv(filename, index=False)
+                logger.info(f"DRY RUN: Saved {len(df)} records to {filename}")
+            except Exception as e:
+                logger.error(f"DRY RUN: Failed to save CSV for {tab_name}: {e}")
         return
 
     try:
-        sh = gc.open_by_key(sheet_id)
-        try:
-            wks = sh.worksheet(tab_name)
-        except gspread.WorksheetNotFound:
-            logger.info(f"Creating new tab: '{tab_name}'")
-            wks = sh.add_worksheet(tab_name, 1, 1)
-
-        logger.info(f"Uploading {len(df)} records to tab '{tab_name}'...")
-        wks.clear()
-        wks.freeze(rows=1)
-        wks.update(
-            [df.columns.tolist()] + df.astype(str).values.tolist(),
-            value_input_option="USER_ENTERED",
-        )
-        logger.info(f"Upload to '{tab_name}' complete.")
+        sheet_ids = {wks.title: wks.id for wks in sh.worksheets()}
+
+        # Size every tab to exactly header + rows and freeze the header,
+        # adding missing tabs with those properties, all in one request.
+        # The writes below then cover every cell, so no separate clear is
+        # needed to drop stale rows or columns.
+        sheet_requests = []
+        for tab_name, df in tabs.items():
+            grid = {
+                "rowCount": len(df) + 1,
+                "columnCount": len(df.columns),
+                "frozenRowCount": 1,
+            }
+            if tab_name in sheet_ids:
+                sheet_requests.append({
+                    "updateSheetProperties": {
+                        "properties": {
+                            "sheetId": sheet_ids[tab_name],
+                            "gridProperties": grid,
+                        },
+                        "fields": "gridProperties(rowCount,columnCount,frozenRowCount)",
+                    }
+                })
+            else:
+                logger.info(f"Creating new tab: '{tab_name}'")
+                sheet_requests.append({
+                    "addSheet": {
+                        "properties": {"title": tab_name, "gridProperties": grid}
+                    }
+                })
+        sh.batch_update({"requests": sheet_requests})
+
+        # One values range per UPLOAD_CHUNK_SIZE rows, packed into as few
+        # requests as UPLOAD_MAX_BYTES of JSON allows (usually just one).
+        # RAW skips Sheets' formula and locale parsing.
+        data = []
+        for tab_name, df in tabs.items():
+            logger.info(f"Uploading {len(df)} records to tab '{tab_name}'...")
+            quoted = "'" + tab_name.replace("'", "''") + "'"
+            values = [df.columns.tolist()] + df.to_numpy(
+                dtype=str, na_value=""
+            ).tolist()
+            for start in range(0, len(values), UPLOAD_CHUNK_SIZE):
+                data.append({
+                    "range": f"{quoted}!A{start + 1}",
+                    "values": values[start:start + UPLOAD_CHUNK_SIZE],
+                })
+
+        batch, batch_bytes = [], 0
+        for entry in data:
+            entry_bytes = len(json.dumps(entry).encode())
+            if batch and batch_bytes + entry_bytes > UPLOAD_MAX_BYTES:
+                sh.values_batch_update({"valueInputOption": "RAW", "data": batch})
+                batch, batch_bytes = [], 0
+            batch.append(entry)
+            batch_bytes += entry_bytes
+        if batch:
+            sh.values_batch_update({"valueInputOption": "RAW", "data": batch})
+        logger.info(f"Upload of {len(tabs)} tabs complete.")
 
     except gspread.exceptions.APIError as e:
-        alert_failure(f"Google Sheets API error during upload to {tab_name}: {e}")
+        alert_failure(f"Google Sheets API error during upload: {e}")
     except Exception as e:
-        alert_failure(f"Upload Failed for {tab_name}: {e}")
+        alert_failure(f"Upload Failed: {e}")
+
+
+def save_backup(df):
+    """
+    Writes the Master Registry to BACKUP_DIR as zstd-compressed Parquet.
+    Dry runs write a dry_run_ preview next to the CSVs instead, leaving the
+    committed backups alone.
+    """
+    try:
+        filename = f"dnafl_backup_{TODAY}.parquet"
+        if DRY_RUN:
+            path = f"dry_run_{filename}"
+        else:
+            os.makedirs(BACKUP_DIR, exist_ok=True)
+            path = os.path.join(BACKUP_DIR, filename)
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        logger.info(f"Saved backup of {len(df)} records to {path}")
+    except Exception as e:
+        logger.error(f"Failed to save backup: {e}")
+
+
+def daily_cache(ttl_hours=20):
+    """
+    Caches a scraper's records as JSON in CACHE_DIR, keyed on the scraper
+    name and TODAY, so a same-day re-run skips the fetch. Empty results and
+    runs that alerted or were cut short are not cached, so the re-run
+    retries them; --no-cache bypasses the cache entirely. The PDF cache
+    entries the scraper used are stored alongside, so a cache hit keeps
+    prune_pdf_cache() from dropping them, and earlier days' files are
+    removed when today's is written.
+    """
+    def decorator(func):
+        stale_re = re.compile(re.escape(func.__name__) + r"_\d{4}-\d{2}-\d{2}\.json")
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            filename = f"{func.__name__}_{TODAY}.json"
+            path = os.path.join(CACHE_DIR, filename)
+            if not NO_CACHE and os.path.exists(path):
+                if time.time() - os.path.getmtime(path) < ttl_hours * 3600:
+                    try:
+                        with open(path, encoding="utf-8") as f:
+                            cached = json.load(f)
+                        data = cached["records"]
+                        pdf_cache_used.update(cached["pdf_cache"])
+                        logger.info(f"{func.__name__}: {len(data)} records from cache.")
+                        return data
+                    except (OSError, ValueError, KeyError, TypeError) as e:
+                        logger.warning(f"Ignoring unreadable cache {path}: {e}")
+
+            scrape_state.incomplete = False
+            scrape_state.pdf_cache = set()
+            try:
+                data = func(*args, **kwargs)
+            finally:
+                pdf_paths = sorted(scrape_state.pdf_cache)
+                scrape_state.pdf_cache = None
+            if data and scrape_state.incomplete:
+                logger.info(f"{func.__name__}: Not caching partial results.")
+            elif data and not NO_CACHE:
+                try:
+                    os.makedirs(CACHE_DIR, exist_ok=True)
+                    with open(path, "w", encoding="utf-8") as f:
+                        json.dump(
+                            {"records": data, "pdf_cache": pdf_paths},
+                            f,
+                            default=str,
+                        )
+                    # Earlier days' results are never read again
+                    for name in os.listdir(CACHE_DIR):
+                        if name != filename and stale_re.fullmatch(name):
+                            os.remove(os.path.join(CACHE_DIR, name))
+                except (OSError, TypeError) as e:
+                    logger.warning(f"Failed to cache {func.__name__}: {e}")
+            return data
+        return wrapper
+    return decorator
 
 
 # --- SCRAPERS ---
 
-def scrape_lee():
+@daily_cache()
+def scrape_lee_enjoined():
     data = []
-    # 1. Enjoined List (Static, keep using BS4 for speed)
+    # Enjoined List (Static, keep using BS4 for speed)
     try:
         resp = fetch_url(
             "https://www.sheriffleefl.org/animal-abuser-registry-enjoined/"
         )
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml")
         table = soup.find("table")
         if table:
             for row in table.find_all("tr")[1:]:
@@ -398,63 +942,51 @@ def scrape_lee():
                     )
     except Exception as e:
         alert_failure(f"Lee Enjoined failed: {str(e)[:200]}")
+    return data
 
-    # 2. Dynamic Registry Search (with pagination)
+
+@daily_cache()
+def scrape_lee_registry():
+    data = []
+    # Dynamic Registry Search (with pagination)
     try:
         with SeleniumDriver() as driver:
             driver.get("https://www.sheriffleefl.org/animal-abuser-search/")
             wait = WebDriverWait(driver, SELENIUM_TIMEOUT)
             try:
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "tbody")))
+                wait.until(EC.presence_of_element_located(DATA_CELL))
             except TimeoutException:
                 logger.warning("Lee Registry: No initial table found.")
             page_num = 1
             while True:
                 try:
-                    rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
+                    rows = extract_table_rows(driver, "table tbody tr")
                     page_count = 0
-                    for row in rows:
-                        try:
-                            cols = row.find_elements(By.TAG_NAME, "td")
-                            if len(cols) >= 4:
-                                name, dob, address, charges = (
-                                    cols[0].text.strip(),
-                                    cols[1].text.strip(),
-                                    cols[2].text.strip(),
-                                    cols[3].text.strip(),
+                    for cols, img_src in rows:
+                        if len(cols) >= 4:
+                            name, dob, address, charges = cols[:4]
+                            if name:
+                                data.append(
+                                    {
+                                        "Name": name,
+                                        "Date": "Unknown",
+                                        "County": "Lee",
+                                        "Source": "Lee Registry",
+                                        "Type": "Convicted",
+                                        "DOB": dob,
+                                        "Address": address,
+                                        "Charges": charges,
+                                        "Link": img_src or "N/A",
+                                    }
                                 )
-                                img_url = "N/A"
-                                try:
-                                    img_elem = row.find_element(By.TAG_NAME, "img")
-                                    src = img_elem.get_attribute("src")
-                                    if src:
-                                        img_url = urljoin(driver.current_url, src)
-                                except NoSuchElementException:
-                                    pass
-                                if name:
-                                    data.append(
-                                        {
-                                            "Name": name,
-                                            "Date": "Unknown",
-                                            "County": "Lee",
-                                            "Source": "Lee Registry",
-                                            "Type": "Convicted",
-                                            "DOB": dob,
-                                            "Address": address,
-                                            "Charges": charges,
-                                            "Link": img_url,
-                                        }
-                                    )
-                                    page_count += 1
-                        except StaleElementReferenceException:
-                            logger.warning(
-                                f"Stale element in Lee row extraction on page {page_num}"
-                            )
-                            continue
+                                page_count += 1
                     logger.info(
                         f"Lee Registry Page {page_num}: Extracted {page_count} records."
                     )
                     try:
+                        first_row = driver.find_element(
+                            By.CSS_SELECTOR, "table tbody tr"
+                        )
                         next_btn = driver.find_element(
                             By.XPATH,
                             "//a[contains(text(),'Next') or contains(text(),'>')]",
@@ -468,10 +1000,8 @@ def scrape_lee():
                         )
                         next_btn.click()
                         page_num += 1
-                        wait.until(EC.staleness_of(rows[0]))
-                        wait.until(
-                            EC.presence_of_element_located((By.TAG_NAME, "tbody"))
-                        )
+                        wait.until(EC.staleness_of(first_row))
+                        wait.until(EC.presence_of_element_located(DATA_CELL))
                     except (NoSuchElementException, TimeoutException):
                         logger.info("Lee Registry: Reached last page.")
                         break
@@ -479,45 +1009,61 @@ def scrape_lee():
                         logger.warning(
                             f"Stale next button on Lee page {page_num}"
                         )
+                        mark_incomplete()
                         break
                 except Exception as e:
                     logger.warning(f"Error on Lee page {page_num}: {e}")
+                    mark_incomplete()
                     break
     except Exception as e:
         alert_failure(f"Lee Registry Selenium failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
-def scrape_marion():
+@daily_cache()
+def scrape_marion_registry():
     data = []
-    # 1. Static Abuser Registry (Convicted) - Using Selenium to bypass 403
+    # Static Abuser Registry (Convicted) - Using Selenium to bypass 403
     registry_url = "https://animalservices.marionfl.org/animal-control/animal-control-and-pet-laws/animal-abuser-registry"
     try:
         with SeleniumDriver() as driver:
             driver.get(registry_url)
             wait = WebDriverWait(driver, SELENIUM_TIMEOUT)
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            entries = soup.find_all(["p", "li"], string=re.compile(r"Name:", re.I))
-            for entry in entries:
-                text = entry.get_text(separator=" | ").strip()
-                name_match = re.search(r"Name:\s*([^|]+)", text, re.I)
-                date_match = re.search(r"(Conviction) Date:\s*([^|]+)", text, re.I)
+            # Plain lxml tree: no BS4 wrapper objects per element.
+            tree = lxml.html.fromstring(driver.page_source)
+            # Every (lowercased alt, src) on the page, for the mugshot fallback
+            images = [
+                ((img.get("alt") or "").lower(), img.get("src"))
+                for img in tree.iter("img")
+            ]
+            for entry in tree.iter("p", "li"):
+                label = single_string(entry)
+                if not label or not MARION_NAME_LABEL_RE.search(label):
+                    continue
+                text = " | ".join(entry.itertext()).strip()
+                name_match = MARION_NAME_RE.search(text)
+                date_match = MARION_DATE_RE.search(text)
                 if name_match:
                     name = name_match.group(1).strip()
                     date = date_match.group(2).strip() if date_match else "Unknown"
                     img_url = "N/A"
                     try:
-                        img_tag = entry.find("img")
-                        if not img_tag:
-                            img_tag = soup.find(
-                                "img",
-                                alt=re.compile(
-                                    re.escape(name.split()[0]) + r".*mugshot", re.I
-                                ),
+                        img_tag = entry.find(".//img")
+                        if img_tag is not None:
+                            src = img_tag.get("src")
+                        else:
+                            # "<first name> ... mugshot" in the alt text; plain
+                            # substring checks instead of a per-name regex.
+                            first = name.split()[0].lower()
+                            src = next(
+                                (src for alt, src in images
+                                 if first in alt
+                                 and "mugshot" in alt[alt.index(first) + len(first):]),
+                                None,
                             )
-                        if img_tag and img_tag.get("src"):
-                            img_url = urljoin(registry_url, img_tag["src"])
+                        if src:
+                            img_url = urljoin(registry_url, src)
                     except Exception:
                         pass
                     data.append(
@@ -533,8 +1079,13 @@ def scrape_marion():
                     )
     except Exception as e:
         alert_failure(f"Marion Registry (Selenium) failed: {str(e)[:200]}")
+    return data
+
 
-    # 2. Dynamic Enjoinment List (Requires Selenium)
+@daily_cache()
+def scrape_marion_enjoined():
+    data = []
+    # Dynamic Enjoinment List (Requires Selenium)
     enjoined_url = "https://animalservices.marionfl.org/animal-control/animal-control-and-pet-laws/civil-enjoinment-list"
     try:
         with SeleniumDriver() as driver:
@@ -554,160 +1105,170 @@ def scrape_marion():
                     f"Marion Enjoined: Query button not found or clickable: {e}"
                 )
             try:
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+                wait.until(EC.presence_of_element_located(DATA_CELL))
             except TimeoutException:
                 logger.warning("Marion Enjoined: No table found after query.")
-                return pd.DataFrame(data)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")[1:]
-            for row in rows:
-                try:
-                    cols = [c.text for c in row.find_elements(By.TAG_NAME, "td")]
-                    if len(cols) >= 4:
-                        data.append(
-                            {
-                                "Name": cols[0],
-                                "Date": cols[2] if cols[2] else "Unknown",
-                                "County": "Marion",
-                                "Source": "Marion Enjoined",
-                                "Type": "Enjoined",
-                                "Address": cols[1],
-                                "CaseNumber": cols[3],
-                            }
-                        )
-                except StaleElementReferenceException:
-                    logger.warning("Stale element in Marion Enjoined row extraction")
-                    continue
+                return data
+            for cols, _ in extract_table_rows(driver, "table tr")[1:]:
+                if len(cols) >= 4:
+                    data.append(
+                        {
+                            "Name": cols[0],
+                            "Date": cols[2] if cols[2] else "Unknown",
+                            "County": "Marion",
+                            "Source": "Marion Enjoined",
+                            "Type": "Enjoined",
+                            "Address": cols[1],
+                            "CaseNumber": cols[3],
+                        }
+                    )
     except Exception as e:
         alert_failure(f"Marion Enjoined (Selenium) failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
-def scrape_hillsborough():
+@daily_cache()
+def scrape_hillsborough_enjoined():
     """
     UPDATED: Enjoined list is now a PDF; extract from PDF with improved parsing.
     """
     data = []
-
-    # --- 1. Enjoined List (PDF) ---
     enjoined_pdf_url = "https://assets.contentstack.io/v3/assets/blteea73b27b731f985/bltc47cc1e37ac0e54a/Enjoinment%20List.pdf"
     try:
         resp = fetch_url(enjoined_pdf_url, stream=False)
-        pdf_file = io.BytesIO(resp.content)
-        with pdfplumber.open(pdf_file) as pdf:
-            for page in pdf.pages:
-                try:
-                    # --- v5.7 FIX: Removed 'keep_blank_chars' ---
-                    table_settings = {
-                        "vertical_strategy": "lines",
-                        "horizontal_strategy": "lines",
-                        "text_tolerance": 1,
-                        "intersection_tolerance": 2,
-                    }
-                    tables = page.extract_tables(table_settings)
-                    for table in tables:
-                        if not table:
+        # --- v5.7 FIX: Removed 'keep_blank_chars' ---
+        table_settings = {
+            "vertical_strategy": "lines",
+            "horizontal_strategy": "lines",
+            "text_tolerance": 1,
+            "intersection_tolerance": 2,
+        }
+        # Table detection is CPU-bound; pages fan out over the PDF pool.
+        for tables in map_pdf_pages(
+            resp.content, _extract_page_tables, table_settings
+        ):
+            try:
+                for table in tables or []:
+                    if not table:
+                        continue
+                    for row in table[1:]:
+                        cleaned_row = [cell.strip() if cell else "" for cell in row]
+                        if (
+                            len([c for c in cleaned_row if c]) < 4
+                            or "Name" in cleaned_row[0]
+                        ):
                             continue
-                        for row in table[1:]:
-                            cleaned_row = [cell.strip() if cell else "" for cell in row]
-                            if (
-                                len([c for c in cleaned_row if c]) < 4
-                                or "Name" in cleaned_row[0]
-                            ):
-                                continue
-                            name, start_date, end_date, restrictions = (
-                                cleaned_row[0],
-                                cleaned_row[1] if len(cleaned_row) > 1 else "Unknown",
-                                cleaned_row[2]
-                                if len(cleaned_row) > 2
-                                else "Permanent",
-                                cleaned_row[3] if len(cleaned_row) > 3 else "N/A",
+                        name, start_date, end_date, restrictions = (
+                            cleaned_row[0],
+                            cleaned_row[1] if len(cleaned_row) > 1 else "Unknown",
+                            cleaned_row[2]
+                            if len(cleaned_row) > 2
+                            else "Permanent",
+                            cleaned_row[3] if len(cleaned_row) > 3 else "N/A",
+                        )
+                        if name:
+                            data.append(
+                                {
+                                    "Name": name, # Name is already "Last, First"
+                                    "Date": start_date,
+                                    "County": "Hillsborough",
+                                    "Source": "Hillsborough Enjoined",
+                                    "Type": "Enjoined",
+                                    "RegistrationEnd": end_date,
+                                    "Charges": restrictions,
+                                    "Details": "Extracted from PDF",
+                                }
                             )
-                            if name:
-                                data.append(
-                                    {
-                                        "Name": name, # Name is already "Last, First"
-                                        "Date": start_date,
-                                        "County": "Hillsborough",
-                                        "Source": "Hillsborough Enjoined",
-                                        "Type": "Enjoined",
-                                        "RegistrationEnd": end_date,
-                                        "Charges": restrictions,
-                                        "Details": "Extracted from PDF",
-                                    }
-                                )
-                except Exception as e:
-                    logger.warning(
-                        f"Error extracting table from Hillsborough Enjoined PDF page: {e}"
-                    )
+            except Exception as e:
+                logger.warning(
+                    f"Error extracting table from Hillsborough Enjoined PDF page: {e}"
+                )
+                mark_incomplete()
         logger.info(
             f"Hillsborough Enjoined: Extracted {len(data)} records from PDF."
         )
     except Exception as e:
         alert_failure(f"Hillsborough Enjoined PDF failed: {str(e)[:200]}")
+    return data
+
+
+HILLSBOROUGH_REGISTRY_URL = "https://hcfl.gov/residents/animals-and-pets/animal-abuser-registry/search-the-registry"
+
+
+def _hillsborough_registry_records(rows):
+    """(cells, img_src) rows from either path -> registry records."""
+    return [
+        {
+            "Name": cols[0],
+            "Date": "Unknown",
+            "County": "Hillsborough",
+            "Source": "Hillsborough Registry",
+            "Type": "Convicted",
+            "DOB": cols[1],
+            "Address": cols[2],
+            "Charges": cols[3],
+            "Link": img_src or "N/A",
+        }
+        for cols, img_src in rows
+        if len(cols) >= 4
+    ]
+
+
+@daily_cache()
+def scrape_hillsborough_registry_static():
+    """
+    Plain-HTTP read of the registry. Returns no records when the page is
+    paginated or holds no real result rows (e.g. only a layout table), so
+    main() queues scrape_hillsborough_registry() in the browser pool.
+    """
+    registry_url = HILLSBOROUGH_REGISTRY_URL
+    try:
+        soup = BeautifulSoup(fetch_url(registry_url).content, "lxml")
+    except Exception as e:
+        logger.warning(f"Hillsborough Registry: HTTP fetch failed: {e}")
+        return []
+    if soup.find("a", string=NEXT_LINK_RE):
+        logger.info("Hillsborough Registry: Paginated; needs Selenium.")
+        return []
+    data = _hillsborough_registry_records(
+        parse_table_rows(soup, registry_url, "table tr")[1:]
+    )
+    if data:
+        logger.info(f"Hillsborough Registry: Read {len(data)} records over HTTP.")
+    return data
+
+
+@daily_cache()
+def scrape_hillsborough_registry():
+    data = []
+    # General Registry (HTML)
+    registry_url = HILLSBOROUGH_REGISTRY_URL
 
-    # --- 2. General Registry (HTML) ---
-    registry_url = "https://hcfl.gov/residents/animals-and-pets/animal-abuser-registry/search-the-registry"
     try:
         with SeleniumDriver() as driver:
             driver.get(registry_url)
             wait = WebDriverWait(driver, SELENIUM_TIMEOUT)
             try:
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+                wait.until(EC.presence_of_element_located(DATA_CELL))
             except TimeoutException:
                 logger.warning("Hillsborough Registry: No table found; appears empty.")
-                return pd.DataFrame(data)
+                return data
 
             page_num = 1
             while True:
                 try:
-                    rows = driver.find_elements(By.CSS_SELECTOR, "table tr")[1:]
+                    rows = extract_table_rows(driver, "table tr")[1:]
                     if not rows:
                         logger.warning(
                             f"Hillsborough Registry: No rows found on page {page_num}."
                         )
                         break
-                    for row in rows:
-                        try:
-                            cols = [
-                                c.text for c in row.find_elements(By.TAG_NAME, "td")
-                            ]
-                            if len(cols) >= 4:
-                                name, dob, address, charges = (
-                                    cols[0],
-                                    cols[1],
-                                    cols[2],
-                                    cols[3],
-                                )
-                                img_url = "N/A"
-                                try:
-                                    img_elem = row.find_element(By.TAG_NAME, "img")
-                                    src = img_elem.get_attribute("src")
-                                    if src:
-                                        img_url = urljoin(driver.current_url, src)
-                                except NoSuchElementException:
-                                    pass
-                                data.append(
-                                    {
-                                        "Name": name,
-                                        "Date": "Unknown",
-                                        "County": "Hillsborough",
-                                        "Source": "Hillsborough Registry",
-                                        "Type": "Convicted",
-                                        "DOB": dob,
-                                        "Address": address,
-                                        "Charges": charges,
-                                        "Link": img_url,
-                                    }
-                                )
-                        except StaleElementReferenceException:
-                            logger.warning(
-                                f"Stale element in Hillsborough Registry row extraction on page {page_num}"
-                            )
-                            continue
+                    data.extend(_hillsborough_registry_records(rows))
                     logger.info(
                         f"Hillsborough Registry: Scraped page {page_num}."
                     )
                     try:
+                        first_row = driver.find_element(By.CSS_SELECTOR, "table tr")
                         next_btn = wait.until(
                             EC.element_to_be_clickable(
                                 (
@@ -726,12 +1287,8 @@ def scrape_hillsborough():
                         )
                         next_btn.click()
                         page_num += 1
-                        wait.until(EC.staleness_of(rows[0]))
-                        wait.until(
-                            EC.presence_of_element_located(
-                                (By.CSS_SELECTOR, "table tr")
-                            )
-                        )
+                        wait.until(EC.staleness_of(first_row))
+                        wait.until(EC.presence_of_element_located(DATA_CELL))
                     except (TimeoutException, NoSuchElementException):
                         logger.info("Hillsborough Registry: No next button found.")
                         break
@@ -739,18 +1296,21 @@ def scrape_hillsborough():
                         logger.warning(
                             f"Stale next button on Hillsborough Registry page {page_num}"
                         )
+                        mark_incomplete()
                         break
                 except Exception as e:
                     logger.warning(
                         f"Error on Hillsborough Registry page {page_num}: {e}"
                     )
+                    mark_incomplete()
                     break
     except Exception as e:
         alert_failure(f"Hillsborough Registry (Selenium) failed: {str(e)[:200]}")
 
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_volusia():
     """
     v6.0 FIX: This PDF is not a table. Switched to regex text parsing.
@@ -767,7 +1327,7 @@ def scrape_volusia():
         # It looks for "Name:", then captures everything until the next "Name:"
         # (?s) = dotall, . matches newline
         # `re.split` is better here, splitting by the delimiter `Name:`
-        entries = re.split(r"Name:", all_text, flags=re.IGNORECASE)
+        entries = VOLUSIA_SPLIT_RE.split(all_text)
         
         if len(entries) <= 1:
             logger.warning("Volusia: PDF split on 'Name:' resulted in 1 entry. Check parser.")
@@ -785,10 +1345,10 @@ def scrape_volusia():
             record = {"Name": name}
 
             # Use re.search to find key-value pairs in the remaining block
-            dob_match = re.search(r"DOB:\s*(.*)", record_text, re.IGNORECASE)
-            case_match = re.search(r"Case Number:\s*(.*)", record_text, re.IGNORECASE)
-            date_match = re.search(r"Conviction Date:\s*(.*)", record_text, re.IGNORECASE)
-            offense_match = re.search(r"Offense:\s*([\s\S]*)", record_text, re.IGNORECASE)
+            dob_match = VOLUSIA_DOB_RE.search(record_text)
+            case_match = VOLUSIA_CASE_RE.search(record_text)
+            date_match = VOLUSIA_DATE_RE.search(record_text)
+            offense_match = VOLUSIA_OFFENSE_RE.search(record_text)
 
             if dob_match:
                 record["DOB"] = dob_match.group(1).strip()
@@ -814,21 +1374,22 @@ def scrape_volusia():
     except Exception as e:
         alert_failure(f"Volusia PDF scraper failed: {str(e)[:200]}")
         
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_seminole():
     data = []
     COUNTY_NAME, SOURCE_NAME, RECORD_TYPE = "Seminole", "Seminole PDF", "Convicted"
     landing_page_url = "https://www.seminolecountyfl.gov/departments-services/prepare-seminole/animal-services/animal-abuse-registry"
     try:
         resp = fetch_url(landing_page_url)
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml")
         pdf_link = soup.find(
-            "a", string=re.compile(r"(view|download|open|access).*registry|report", re.I)
+            "a", string=SEMINOLE_LINK_TEXT_RE
         )
         if not pdf_link:
-            pdf_link = soup.find("a", href=re.compile(r"AnimalCruelty", re.I))
+            pdf_link = soup.find("a", href=SEMINOLE_LINK_HREF_RE)
         if not pdf_link or not pdf_link.get("href"):
             logger.warning(
                 "Seminole: Could not find dynamic PDF link, trying old static link..."
@@ -839,7 +1400,7 @@ def scrape_seminole():
             logger.info(f"Seminole: Found dynamic PDF link: {pdf_url}")
 
         all_text = "\n".join(extract_text_from_pdf(pdf_url))
-        entries = re.split(r"(?=\nName:)", "\n" + all_text, flags=re.IGNORECASE)
+        entries = SEMINOLE_SPLIT_RE.split("\n" + all_text)
         for entry in entries:
             if not entry.strip() or "Name:" not in entry:
                 continue
@@ -848,7 +1409,7 @@ def scrape_seminole():
                 line = line.strip()
                 if not line:
                     continue
-                match = re.match(r"^([^:]{1,30}):\s*(.*)", line)
+                match = SEMINOLE_FIELD_RE.match(line)
                 if match:
                     current_key, value = match.groups()
                     current_key = current_key.strip()
@@ -889,14 +1450,55 @@ def scrape_seminole():
                 )
     except Exception as e:
         alert_failure(f"Seminole PDF scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
+
+
+PASCO_URL = "https://app.pascoclerk.com/animalabusersearch/"
+
+
+def _pasco_records(rows):
+    """(cells, img_src) rows from either path -> Pasco records."""
+    return [
+        {
+            "Name": cols[0],
+            "Date": cols[2],
+            "County": "Pasco",
+            "Source": "Pasco Clerk App",
+            "Type": "Convicted",
+            "CaseNumber": cols[1],
+        }
+        for cols, _ in rows
+        if len(cols) >= 3
+    ]
 
 
+@daily_cache()
+def scrape_pasco_static():
+    """
+    Plain-HTTP read of the Pasco results. Returns no records when the page
+    holds no real result rows (e.g. only the search form), so main() queues
+    the scrape_pasco() search in the browser pool.
+    """
+    url = PASCO_URL
+    try:
+        soup = BeautifulSoup(fetch_url(url).content, "lxml")
+    except Exception as e:
+        logger.warning(f"Pasco: HTTP fetch failed: {e}")
+        return []
+    # Parsers don't synthesize <tbody>; header <th> rows have no cells
+    data = _pasco_records(parse_table_rows(soup, url, "table tr"))
+    if data:
+        logger.info(f"Pasco: Read {len(data)} records over HTTP.")
+    return data
+
+
+@daily_cache()
 def scrape_pasco():
     data = []
+    url = PASCO_URL
     try:
         with SeleniumDriver() as driver:
-            driver.get("https://app.pascoclerk.com/animalabusersearch/")
+            driver.get(url)
             try:
                 btn_css = "button[type='submit'], .btn-search"
                 btn = WebDriverWait(driver, 10).until(
@@ -907,48 +1509,32 @@ def scrape_pasco():
                 logger.warning(f"Pasco: Search button not found or clickable: {e}")
             try:
                 WebDriverWait(driver, SELENIUM_TIMEOUT).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "tr"))
+                    EC.presence_of_element_located(DATA_CELL)
                 )
             except TimeoutException:
                 logger.warning("Pasco: No table found after search.")
-                return pd.DataFrame(data)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tbody tr")
-            for row in rows:
-                try:
-                    cols = [c.text for c in row.find_elements(By.TAG_NAME, "td")]
-                    if len(cols) >= 3:
-                        data.append(
-                            {
-                                "Name": cols[0],
-                                "Date": cols[2],
-                                "County": "Pasco",
-                                "Source": "Pasco Clerk App",
-                                "Type": "Convicted",
-                                "CaseNumber": cols[1],
-                            }
-                        )
-                except StaleElementReferenceException:
-                    logger.warning("Stale element in Pasco row extraction")
-                    continue
+                return data
+            data = _pasco_records(extract_table_rows(driver, "table tbody tr"))
     except Exception as e:
         alert_failure(f"Pasco App failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_collier():
     data = []
     try:
         resp = fetch_url(
             "https://www2.colliersheriff.org/animalabusesearch", verify=False
         )
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml")
         for row in soup.select("table tr")[1:]:
             cols = [c.get_text(strip=True) for c in row.find_all("td")]
             if len(cols) >= 6:
                 date = (
                     cols[5]
                     if cols[5] not in ["N/A", ""]
-                    else datetime.now().strftime("%Y-%m-%d")
+                    else TODAY
                 )
                 data.append(
                     {
@@ -963,9 +1549,10 @@ def scrape_collier():
                 )
     except Exception as e:
         alert_failure(f"Collier failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_osceola():
     """
     v6.0 FIX: Switched to regex text parsing to find lines
@@ -974,21 +1561,18 @@ def scrape_osceola():
     data = []
     pdf_url = "https://courts.osceolaclerk.com/reports/AnimalCrueltyReportWeb.pdf"
     
-    # Regex to find a case number format like 2024-MM-001234
-    case_regex = re.compile(r"(\d{4}-\w{2}-\d{6})")
-    
     try:
         # Get one text block per page
         page_texts = extract_text_from_pdf(pdf_url)
         
         if not page_texts or "no records found" in page_texts[0].lower():
             logger.warning("Osceola: PDF appears to be empty or says 'no records found'.")
-            return pd.DataFrame(data)
+            return data
 
         for page_text in page_texts:
             for line in page_text.split('\n'):
                 line = line.strip().replace("’", "'") # Fix encoding
-                match = case_regex.search(line)
+                match = OSCEOLA_CASE_RE.search(line)
                 
                 if match:
                     case_num = match.group(1)
@@ -1013,15 +1597,16 @@ def scrape_osceola():
                     )
     except Exception as e:
         alert_failure(f"Osceola PDF scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_broward():
-    data = []
     logger.info("Broward County no longer has a public animal abuse registry as of 2025.")
-    return pd.DataFrame(data)
+    return None
 
 
+@daily_cache()
 def scrape_leon():
     data = []
     COUNTY_NAME, SOURCE_NAME, RECORD_TYPE = (
@@ -1046,46 +1631,33 @@ def scrape_leon():
                         f"{COUNTY_NAME}: No table found on page {page_num}."
                     )
                     break
-                rows = table.find_elements(By.TAG_NAME, "tr")[1:]
+                rows = extract_table_rows(
+                    driver, f"#{table_id} tr:not(.gridPager)"
+                )[1:]
                 if not rows and page_num == 1:
                     logger.warning(f"{COUNTY_NAME}: Table found but no data rows.")
                     break
-                rows = [
-                    row
-                    for row in rows
-                    if "gridPager" not in row.get_attribute("class")
-                ]
                 logger.info(f"{COUNTY_NAME}: Scraping page {page_num}...")
-                for row in rows:
-                    try:
-                        cols = [
-                            c.text.strip()
-                            for c in row.find_elements(By.TAG_NAME, "td")
-                        ]
-                        # [Name, Address, Offense Date, Conviction Date, Exp. Date, Offense]
-                        if len(cols) >= 6:
-                            data.append(
-                                {
-                                    "Name": cols[0],
-                                    "Date": cols[3],
-                                    "County": COUNTY_NAME,
-                                    "Source": SOURCE_NAME,
-                                    "Type": RECORD_TYPE,
-                                    "Address": cols[1],
-                                    "Charges": cols[5],
-                                    "RegistrationEnd": cols[4],
-                                    "Details": f"Offense Date: {cols[2]}",
-                                }
-                            )
-                    except StaleElementReferenceException:
-                        logger.warning(
-                            f"Stale element in {COUNTY_NAME} row extraction on page {page_num}"
+                for cols, _ in rows:
+                    # [Name, Address, Offense Date, Conviction Date, Exp. Date, Offense]
+                    if len(cols) >= 6:
+                        data.append(
+                            {
+                                "Name": cols[0],
+                                "Date": cols[3],
+                                "County": COUNTY_NAME,
+                                "Source": SOURCE_NAME,
+                                "Type": RECORD_TYPE,
+                                "Address": cols[1],
+                                "Charges": cols[5],
+                                "RegistrationEnd": cols[4],
+                                "Details": f"Offense Date: {cols[2]}",
+                            }
                         )
-                        continue
                 try:
                     if not rows:
                         break
-                    first_row = rows[0]
+                    first_row = table.find_element(By.TAG_NAME, "tr")
                     next_btn = driver.find_element(By.LINK_TEXT, ">")
                     driver.execute_script(
                         "arguments[0].scrollIntoView(true);", next_btn
@@ -1098,12 +1670,14 @@ def scrape_leon():
                     break
                 except Exception as e:
                     logger.warning(f"{COUNTY_NAME}: Pagination error: {e}")
+                    mark_incomplete()
                     break
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_polk():
     """
     Restored: This scraper uses Selenium because the div.registrant elements
@@ -1124,21 +1698,19 @@ def scrape_polk():
                 )
             except TimeoutException:
                 logger.warning("Polk: No 'div.registrant' elements found on page.")
-                return pd.DataFrame(data)
+                return data
 
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            registrants = soup.find_all("div", class_="registrant")
+            tree = extract_fragment(driver, "div.registrant")
+            registrants = POLK_REGISTRANT_XPATH(tree)
             logger.info(f"Polk: Found {len(registrants)} registrant divs.")
 
             for reg in registrants:
                 try:
-                    name = reg.find("h3").get_text(strip=True)
+                    name = stripped_text(reg.find(".//h3"))
                     info = {
-                        p.find("strong").get_text(strip=True).replace(":", ""): p.find(
-                            "span"
-                        ).get_text(strip=True)
-                        for p in reg.find_all("p")
-                        if p.find("strong") and p.find("span")
+                        stripped_text(p.find(".//strong")).replace(":", ""):
+                            stripped_text(p.find(".//span"))
+                        for p in POLK_FIELD_XPATH(reg)
                     }
                     data.append(
                         {
@@ -1157,17 +1729,19 @@ def scrape_polk():
                     )
                 except Exception as e:
                     logger.warning(f"Polk: Failed to parse a registrant div: {e}")
+                    mark_incomplete()
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_orange():
-    data = []
     logger.info("Orange County no public animal abuse registry as of 2025.")
-    return pd.DataFrame(data)
+    return None
 
 
+@daily_cache()
 def scrape_palmbeach():
     """
     Restored: This site URL changed. This is the new, working URL.
@@ -1183,17 +1757,17 @@ def scrape_palmbeach():
 
     try:
         resp = fetch_url(url)
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml")
         
         table = soup.find(
-            "table", summary=re.compile(r"Animal Abuse Registry", re.I)
+            "table", summary=PALMBEACH_SUMMARY_RE
         )
         if not table:
-            table = soup.find("table", id=re.compile(r"Registry", re.I))
+            table = soup.find("table", id=PALMBEACH_ID_RE)
         
         if not table:
             logger.warning("Palm Beach: No table found on page.")
-            return pd.DataFrame(data)
+            return data
             
         for row in table.find_all("tr")[1:]:
             cols = [c.get_text(strip=True) for c in row.find_all("td")]
@@ -1214,17 +1788,53 @@ def scrape_palmbeach():
     except Exception as e:
         # This will likely fail if the Kali VM has DNS issues
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
+
+
+MIAMIDADE_URL = "https://www.miamidade.gov/Apps/ASD/crueltyweb/"
+
+
+def _miamidade_records(rows):
+    """(cells, img_src) rows from either path -> Miami-Dade records."""
+    return [
+        {
+            "Name": cols[0],
+            "Date": cols[2] if cols[2] else "Unknown",
+            "County": "Miami-Dade",
+            "Source": "Miami-Dade Registry",
+            "Type": "Convicted",
+            "DOB": cols[1],
+            "Details": " | ".join(cols[3:]) if len(cols) > 3 else "N/A",
+        }
+        for cols, _ in rows
+        if len(cols) >= 3
+    ]
+
+
+@daily_cache()
+def scrape_miamidade_static():
+    """
+    Plain-HTTP read of the crueltyweb results. Returns no records when the
+    page holds no real result rows, so main() queues the scrape_miamidade()
+    query in the browser pool.
+    """
+    url = MIAMIDADE_URL
+    try:
+        soup = BeautifulSoup(fetch_url(url).content, "lxml")
+    except Exception as e:
+        logger.warning(f"Miami-Dade: HTTP fetch failed: {e}")
+        return []
+    data = _miamidade_records(parse_table_rows(soup, url, "table tr")[1:])
+    if data:
+        logger.info(f"Miami-Dade: Read {len(data)} records over HTTP.")
+    return data
 
 
+@daily_cache()
 def scrape_miamidade():
     data = []
-    COUNTY_NAME, SOURCE_NAME, RECORD_TYPE = (
-        "Miami-Dade",
-        "Miami-Dade Registry",
-        "Convicted",
-    )
-    url = "https://www.miamidade.gov/Apps/ASD/crueltyweb/"
+    COUNTY_NAME = "Miami-Dade"
+    url = MIAMIDADE_URL
     try:
         with SeleniumDriver() as driver:
             driver.get(url)
@@ -1234,7 +1844,9 @@ def scrape_miamidade():
                 query_button = wait.until(
                     EC.element_to_be_clickable((By.XPATH, query_btn_xpath))
                 )
-                driver.execute_script("arguments[0].scrollIntoView();", query_button)
+                driver.execute_script(
+                    "arguments[0].scrollIntoView();", query_button
+                )
                 query_button.click()
             except (NoSuchElementException, TimeoutException) as e:
                 logger.warning(
@@ -1244,45 +1856,61 @@ def scrape_miamidade():
                     f"{COUNTY_NAME}: No search button found, assuming data loads automatically."
                 )
             try:
-                table = wait.until(
-                    EC.presence_of_element_located((By.TAG_NAME, "table"))
-                )
+                wait.until(EC.presence_of_element_located(DATA_CELL))
             except TimeoutException:
                 logger.warning(f"{COUNTY_NAME}: No table found.")
-                return pd.DataFrame(data)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")[1:]
-            for row in rows:
-                try:
-                    cols = [
-                        c.text.strip() for c in row.find_elements(By.TAG_NAME, "td")
-                    ]
-                    if len(cols) >= 3:
-                        details = " | ".join(cols[3:]) if len(cols) > 3 else "N/A"
-                        data.append(
-                            {
-                                "Name": cols[0],
-                                "Date": cols[2] if cols[2] else "Unknown",
-                                "County": COUNTY_NAME,
-                                "Source": SOURCE_NAME,
-                                "Type": RECORD_TYPE,
-                                "DOB": cols[1],
-                                "Details": details,
-                            }
-                        )
-                except StaleElementReferenceException:
-                    logger.warning(
-                        f"Stale element in {COUNTY_NAME} row extraction"
-                    )
-                    continue
+                return data
+            data = _miamidade_records(extract_table_rows(driver, "table tr")[1:])
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
+
+
+BREVARD_URL = "https://www.brevardfl.gov/AnimalAbuseDatabaseSearch"
+
+
+def _brevard_records(rows):
+    """(cells, img_src) rows from either path -> Brevard records."""
+    return [
+        {
+            "Name": cols[0],
+            "Date": cols[2] if cols[2] else "Unknown",
+            "County": "Brevard",
+            "Source": "Brevard Registry",
+            "Type": "Convicted",
+            "CaseNumber": cols[1],
+            "Details": " | ".join(cols[3:]) if len(cols) > 3 else "N/A",
+        }
+        for cols, _ in rows
+        if len(cols) >= 3
+    ]
 
 
+@daily_cache()
+def scrape_brevard_static():
+    """
+    Plain-HTTP read of the Brevard search. Returns no records when the page
+    holds no real result rows, so main() queues the scrape_brevard() search
+    in the browser pool.
+    """
+    # The search form is a plain GET; an empty name lists everyone.
+    search_url = f"{BREVARD_URL}?defendantName="
+    try:
+        soup = BeautifulSoup(fetch_url(search_url).content, "lxml")
+    except Exception as e:
+        logger.warning(f"Brevard: HTTP fetch failed: {e}")
+        return []
+    data = _brevard_records(parse_table_rows(soup, search_url, "table tr")[1:])
+    if data:
+        logger.info(f"Brevard: Read {len(data)} records over HTTP.")
+    return data
+
+
+@daily_cache()
 def scrape_brevard():
     data = []
-    COUNTY_NAME, SOURCE_NAME, RECORD_TYPE = "Brevard", "Brevard Registry", "Convicted"
-    url = "https://www.brevardfl.gov/AnimalAbuseDatabaseSearch"
+    COUNTY_NAME = "Brevard"
+    url = BREVARD_URL
     try:
         with SeleniumDriver() as driver:
             driver.get(url)
@@ -1299,47 +1927,29 @@ def scrape_brevard():
                 query_button = wait.until(
                     EC.element_to_be_clickable((By.XPATH, query_btn_xpath))
                 )
-                driver.execute_script("arguments[0].scrollIntoView();", query_button)
+                driver.execute_script(
+                    "arguments[0].scrollIntoView();", query_button
+                )
                 query_button.click()
             except (NoSuchElementException, TimeoutException) as e:
                 logger.warning(
                     f"{COUNTY_NAME}: Search button not found or clickable: {e}"
                 )
-                logger.info(f"{COUNTY_NAME}: No search button, assuming auto-load.")
+                logger.info(
+                    f"{COUNTY_NAME}: No search button, assuming auto-load."
+                )
             try:
-                wait.until(EC.presence_of_element_located((By.TAG_NAME, "tr")))
+                wait.until(EC.presence_of_element_located(DATA_CELL))
             except TimeoutException:
                 logger.warning(f"{COUNTY_NAME}: No results table found.")
-                return pd.DataFrame(data)
-            rows = driver.find_elements(By.CSS_SELECTOR, "table tr")[1:]
-            for row in rows:
-                try:
-                    cols = [
-                        c.text.strip() for c in row.find_elements(By.TAG_NAME, "td")
-                    ]
-                    if len(cols) >= 3:
-                        details = " | ".join(cols[3:]) if len(cols) > 3 else "N/A"
-                        data.append(
-                            {
-                                "Name": cols[0],
-                                "Date": cols[2] if cols[2] else "Unknown",
-                                "County": COUNTY_NAME,
-                                "Source": SOURCE_NAME,
-                                "Type": RECORD_TYPE,
-                                "CaseNumber": cols[1],
-                                "Details": details,
-                            }
-                        )
-                except StaleElementReferenceException:
-                    logger.warning(
-                        f"Stale element in {COUNTY_NAME} row extraction"
-                    )
-                    continue
+                return data
+            data = _brevard_records(extract_table_rows(driver, "table tr")[1:])
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_manatee():
     """
     v5.7 FIX: Correctly map columns.
@@ -1353,11 +1963,11 @@ def scrape_manatee():
     )
     try:
         resp = fetch_url(url, verify=False)
-        soup = BeautifulSoup(resp.content, "html.parser")
+        soup = BeautifulSoup(resp.content, "lxml")
         table = soup.find("table")
         if not table:
             logger.warning(f"{COUNTY_NAME}: No table found on page.")
-            return pd.DataFrame(data)
+            return data
             
         for row in table.find_all("tr")[1:]:
             cols = [c.get_text(strip=True) for c in row.find_all("td")]
@@ -1388,11 +1998,11 @@ def scrape_manatee():
                 )
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return data
 
 
+@daily_cache()
 def scrape_sarasota():
-    data = []
     COUNTY_NAME = "Sarasota"
     url = "https://www.sarasotasheriff.org/programs_and_amp_services/animal_services/vicious_dangerous_dogs.php"
     try:
@@ -1402,11 +2012,11 @@ def scrape_sarasota():
         )
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return None
 
 
+@daily_cache()
 def scrape_charlotte():
-    data = []
     COUNTY_NAME = "Charlotte"
     url = (
         "https://www.charlottecountyfl.gov/departments/public-safety/animal-control/"
@@ -1416,12 +2026,14 @@ def scrape_charlotte():
         logger.info(f"{COUNTY_NAME}: No public abuser registry found on the page.")
     except Exception as e:
         alert_failure(f"{COUNTY_NAME} scraper failed: {str(e)[:200]}")
-    return pd.DataFrame(data)
+    return None
 
 
 # --- ORCHESTRATOR ---
 
 def main():
+    global TODAY
+    TODAY = datetime.now().strftime("%Y-%m-%d")
     start_ts = time.time()
     logger.info("Starting DNAFL Scraper Job v6.0 (Volusia/Hillsborough Fix)...")
     gc = get_gspread_client()
@@ -1429,81 +2041,158 @@ def main():
         logger.critical("Credentials missing. Aborting.")
         sys.exit(1)
 
-    # Define tasks as a dict {Tab Name: function}
-    tasks = {
-        "Lee": scrape_lee,
-        "Marion": scrape_marion,
-        "Hillsborough": scrape_hillsborough,
-        "Volusia": scrape_volusia,
-        "Seminole": scrape_seminole,
-        "Pasco": scrape_pasco,
-        "Collier": scrape_collier,
-        "Osceola": scrape_osceola,
-        "Broward": scrape_broward,  # Kept, but function logs no data
-        "Leon": scrape_leon,
-        "Polk": scrape_polk,  # Restored
-        "Orange": scrape_orange,  # Kept, but function logs no data
-        "Palm Beach": scrape_palmbeach,  # Restored
-        "Miami-Dade": scrape_miamidade,
-        "Brevard": scrape_brevard,
-        "Manatee": scrape_manatee,
-        "Sarasota": scrape_sarasota,
-        "Charlotte": scrape_charlotte,
-    }
-
-    all_data_frames = {}
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        future_map = {
-            executor.submit(func): tab_name for tab_name, func in tasks.items()
-        }
-
-        for future in as_completed(future_map):
-            tab_name = future_map[future]
-            try:
-                df = future.result()
-                if not df.empty:
-                    logger.info(f"[{tab_name}] Success: {len(df)} records.")
-                    all_data_frames[tab_name] = df
-                else:
-                    logger.warning(f"[{tab_name}] yielded 0 records.")
-            except Exception as e:
-                alert_failure(f"CRITICAL: Scraper for {tab_name} crashed: {e}")
-
-    if all_data_frames:
-        standardized_dfs = []
-
-        for tab_name, df in all_data_frames.items():
-            if df.empty:
-                continue
+    # Open the workbook once, up front: a bad SHEET_ID or missing share
+    # fails before any scraping, and uploads reuse the handle.
+    sh = None
+    if gc and not DRY_RUN:
+        try:
+            sh = gc.open_by_key(SHEET_ID)
+        except Exception as e:
+            alert_failure(f"Could not open spreadsheet {SHEET_ID}: {e}")
+            sys.exit(1)
 
-            logger.info(f"Standardizing data for {tab_name}...")
-            standardized_df = standardize_data(df)
+    # Define tasks as (Tab Name, function) pairs, split by which pool they
+    # need. Scrapers with any Selenium path go in the small browser pool;
+    # sources with a static and a dynamic list feed one tab from both.
+    selenium_tasks = [
+        ("Lee", scrape_lee_registry),
+        ("Marion", scrape_marion_registry),
+        ("Marion", scrape_marion_enjoined),
+        ("Leon", scrape_leon),
+        ("Polk", scrape_polk),  # Restored
+    ]
+    # (Tab Name, plain-HTTP read, Selenium fallback). The static read holds
+    # an HTTP worker, not a browser slot; Chrome is queued only if it comes
+    # back empty, or straight away when USE_SELENIUM says so.
+    fallback_tasks = [
+        ("Hillsborough", scrape_hillsborough_registry_static, scrape_hillsborough_registry),
+        ("Pasco", scrape_pasco_static, scrape_pasco),
+        ("Miami-Dade", scrape_miamidade_static, scrape_miamidade),
+        ("Brevard", scrape_brevard_static, scrape_brevard),
+    ]
+    http_tasks = [
+        ("Lee", scrape_lee_enjoined),
+        ("Hillsborough", scrape_hillsborough_enjoined),
+        ("Volusia", scrape_volusia),
+        ("Seminole", scrape_seminole),
+        ("Collier", scrape_collier),
+        ("Osceola", scrape_osceola),
+        ("Broward", scrape_broward),  # Stub: logs and returns None
+        ("Orange", scrape_orange),  # Stub: logs and returns None
+        ("Palm Beach", scrape_palmbeach),  # Restored
+        ("Manatee", scrape_manatee),
+        ("Sarasota", scrape_sarasota),
+        ("Charlotte", scrape_charlotte),
+    ]
 
-            if not standardized_df.empty:
-                upload_to_sheet(gc, SHEET_ID, tab_name, standardized_df)
-                standardized_dfs.append(standardized_df)
+    all_records = {}
+    with ThreadPoolExecutor(
+        max_workers=MAX_SELENIUM_WORKERS, thread_name_prefix="sel"
+    ) as selenium_pool, ThreadPoolExecutor(
+        max_workers=min(len(http_tasks) + len(fallback_tasks), MAX_HTTP_WORKERS),
+        thread_name_prefix="http",
+    ) as http_pool:
+        # future -> (tab name, function name, Selenium fallback or None)
+        future_map = {
+            pool.submit(func): (tab_name, func.__name__, None)
+            for pool, tasks in (
+                (selenium_pool, selenium_tasks),
+                (http_pool, http_tasks),
+            )
+            for tab_name, func in tasks
+        }
+        for tab_name, static_func, selenium_func in fallback_tasks:
+            if USE_SELENIUM[tab_name]:
+                future_map[selenium_pool.submit(selenium_func)] = (
+                    tab_name, selenium_func.__name__, None
+                )
             else:
-                logger.warning(
-                    f"No data remaining for {tab_name} after standardization."
+                future_map[http_pool.submit(static_func)] = (
+                    tab_name, static_func.__name__, selenium_func
                 )
 
-        if standardized_dfs:
-            logger.info("Concatenating all dataframes for Master Registry...")
-            master_df = pd.concat(standardized_dfs, ignore_index=True)
-            master_df = standardize_data(master_df)
+        # Fallbacks queued during a pass are collected by the next one.
+        while future_map:
+            for future in as_completed(list(future_map)):
+                tab_name, func_name, fallback = future_map.pop(future)
+                try:
+                    records = future.result()
+                    if records is None:
+                        # Stub for a county with no public list; it logs why.
+                        continue
+                    if records:
+                        logger.info(
+                            f"[{tab_name}] {func_name}: {len(records)} records."
+                        )
+                        all_records.setdefault(tab_name, []).extend(records)
+                    elif fallback:
+                        logger.info(
+                            f"[{tab_name}] {func_name}: Nothing over HTTP; "
+                            f"queueing {fallback.__name__}."
+                        )
+                        future_map[selenium_pool.submit(fallback)] = (
+                            tab_name, fallback.__name__, None
+                        )
+                    else:
+                        logger.warning(f"[{tab_name}] {func_name} yielded 0 records.")
+                except Exception as e:
+                    alert_failure(f"CRITICAL: Scraper {func_name} for {tab_name} crashed: {e}")
+                    if fallback:
+                        future_map[selenium_pool.submit(fallback)] = (
+                            tab_name, fallback.__name__, None
+                        )
+
+    # Scraping is done; release the pooled browsers before the upload phase.
+    quit_all_drivers()
+
+    if all_records:
+        # Standardize and dedupe everything once; every scraper stamps
+        # County with its tab name, so the per-tab frames are just groups
+        # of the finished master (already deduped and sorted).
+        # Built straight into the schema as StringDtype: no per-column
+        # object inference, and fields outside FINAL_COLUMNS are skipped.
+        logger.info("Building Master Registry from all records...")
+        master_df = standardize_data(
+            pd.DataFrame(
+                dedupe_records(chain.from_iterable(all_records.values())),
+                columns=FINAL_COLUMNS,
+                dtype=STRING_DTYPE,
+            )
+        )
+
+        if not master_df.empty:
+            groups = dict(tuple(master_df.groupby("County", observed=True)))
+            standardized_dfs = {}
+            for tab_name in all_records:
+                if tab_name in groups:
+                    standardized_dfs[tab_name] = groups[tab_name]
+                else:
+                    logger.warning(
+                        f"No data remaining for {tab_name} after standardization."
+                    )
 
             logger.info(f"TOTAL UNIQUE RECORDS: {len(master_df)}")
-            upload_to_sheet(gc, SHEET_ID, MASTER_TAB_NAME, master_df)
+            # Every tab goes up together in a handful of batched requests.
+            upload_tabs(sh, {**standardized_dfs, MASTER_TAB_NAME: master_df})
+            save_backup(master_df)
         else:
-            logger.warning(
-                "No data collected from any scraper. Master list not updated."
+            # Every county tab comes out of this one frame, so an empty
+            # result here loses the whole upload, not a single tab.
+            alert_failure(
+                "Standardization produced no records from "
+                f"{sum(map(len, all_records.values()))} scraped; "
+                "Master list not updated."
             )
+            if not DRY_RUN:
+                sys.exit(1)
 
     else:
         alert_failure("Global Failure: No data scraped from any source.")
         if not DRY_RUN:
             sys.exit(1)
 
+    shutdown_pdf_pool()
+    prune_pdf_cache()
     logger.info(f"Job finished in {time.time() - start_ts:.1f}s")
     logger.info("Note: Statewide registry under Dexter's Law to be implemented by Jan 2026.")
 